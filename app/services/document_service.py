@@ -4,16 +4,16 @@ import uuid
 import PyPDF2
 from datetime import datetime
 from docx import Document as DocxDocument
-from langchain.text_splitter import RecursiveCharacterTextSplitter
 from fastapi import HTTPException
 
 from app.services.embedding_service import (
+    count_embedding_tokens,
     get_embeddings,
     get_vector_store,
     save_vector_store,
 )
 from app.database import documents_collection, chunks_collection
-from app.utils.text_processor import clean_text
+from app.utils.text_processor import clean_text, chunk_text
 
 
 # ------------------------------
@@ -27,7 +27,6 @@ async def process_and_store_documents(files):
     try:
         embeddings = get_embeddings()
         vector_store = get_vector_store()
-        text_splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
 
         uploaded_docs = []
 
@@ -49,7 +48,7 @@ async def process_and_store_documents(files):
                 raise HTTPException(status_code=400, detail=f"No readable text in {file_name}")
 
             # --- Step 2: Split into chunks ---
-            chunks = text_splitter.split_text(cleaned_text)
+            chunks = chunk_text(cleaned_text, token_counter=count_embedding_tokens)
 
             # --- Step 3: Store document metadata ---
             doc_meta = {
@@ -12,6 +12,9 @@ def get_embeddings():
         embeddings_model = HuggingFaceEmbeddings(model_name="sentence-transformers/all-MiniLM-L6-v2")
     return embeddings_model
 
+def count_embedding_tokens(text: str) -> int:
+    return len(get_embeddings().client.tokenizer.tokenize(text))
+
 def get_vector_store():
     global vector_store
     if vector_store is None and os.path.exists(FAISS_INDEX_PATH):
@@ -1,18 +1,205 @@
 import re
+import unicodedata
+from collections import deque
+from typing import Callable, Iterable, Iterator, Union
+
+# C0/C1 control characters that are not whitespace, plus zero-width space and BOM.
+# Whitespace (including Unicode spaces) is collapsed separately by str.split().
+_CONTROL_RE = re.compile(r"[\x00-\x08\x0e-\x1b\x7f-\x84\x86-\x9f\u200b\ufeff]+")
+# Scripts written without spaces between words (Thai, Lao, Myanmar, Khmer, kana, CJK
+# ideographs); each character counts as a token.
+_NO_SPACE_CHARS = "\u0e00-\u0eff\u1000-\u109f\u1780-\u17ff\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff"
+# ASCII terminators need trailing whitespace; full-width ones end a sentence on their own.
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+|(?<=[。！？])\s*")
+# Longest run of letters/digits counted as a single token, so unspaced text,
+# hashes, base64 and long URLs still count (and split) in bounded pieces.
+_MAX_TOKEN_CHARS = 10
+
+
+def _combining_marks() -> str:
+    """
+    Builds a character class body of the combining marks in the BMP, which
+    re's \\w does not match (e.g. accents in NFD text, Indic vowel signs).
+    """
+    ranges = []
+    start = None
+    for cp in range(0x10001):
+        is_mark = cp < 0x10000 and unicodedata.category(chr(cp)).startswith("M")
+        if is_mark and start is None:
+            start = cp
+        elif not is_mark and start is not None:
+            ranges.append(f"\\u{start:04x}-\\u{cp - 1:04x}")
+            start = None
+    return "".join(ranges)
+
+
+_WORD_CHAR = rf"(?:[^\W{_NO_SPACE_CHARS}]|[{_combining_marks()}])"
+_TOKEN_RE = re.compile(rf"[{_NO_SPACE_CHARS}]|{_WORD_CHAR}{{1,{_MAX_TOKEN_CHARS}}}|[^\w\s]")
+
+# Sized for all-MiniLM-L6-v2 (256 wordpieces) when counting with its tokenizer.
+# count_tokens is only a word-level approximation and undercounts subwords.
+DEFAULT_MAX_TOKENS = 200
+DEFAULT_OVERLAP_TOKENS = 40
+
 
 def clean_text(text: str) -> str:
     """
-    Cleans extracted text by removing control chars, extra spaces, and newlines.
+    Cleans extracted text by removing control chars and collapsing whitespace.
+    Non-ASCII characters (accents, non-Latin scripts) are preserved.
+    """
+    return " ".join(_CONTROL_RE.sub("", text).split())
+
+
+def iter_clean_text(pieces: Iterable[str]) -> Iterator[str]:
+    """
+    Streaming version of clean_text. Joining the yielded pieces gives the same
+    result as clean_text on the concatenated input.
     """
-    text = re.sub(r"\s+", " ", text)  # collapse whitespace
-    text = text.replace("\x00", "")   # remove null bytes
-    text = re.sub(r"[^ -~]+", " ", text)  # remove non-ASCII chars
-    return text.strip()
+    started = False
+    pending_space = False
+    for piece in pieces:
+        piece = _CONTROL_RE.sub("", piece)
+        if not piece:
+            continue
+        words = piece.split()
+        if not words:
+            pending_space = started
+            continue
+        if started and piece[0].isspace():
+            pending_space = True
+        yield (" " if pending_space else "") + " ".join(words)
+        started = True
+        pending_space = piece[-1].isspace()
 
 
 def split_sentences(text: str) -> list:
     """
     Splits a large text blob into sentences. Optional helper for chunking.
     """
-    sentences = re.split(r'(?<=[.!?]) +', text)
+    sentences = _SENTENCE_END_RE.split(text)
     return [s.strip() for s in sentences if s.strip()]
+
+
+def iter_sentences(pieces: Iterable[str]) -> Iterator[str]:
+    """
+    Streaming version of split_sentences. Text after the last sentence
+    boundary is held back until more input arrives.
+    """
+    pending = []
+    prev = ""
+    for piece in pieces:
+        if not piece:
+            continue
+        # Rescan only the new piece, plus one character of context so a
+        # terminator at the end of the previous piece is still seen.
+        text = prev + piece
+        start = len(prev)
+        for match in _SENTENCE_END_RE.finditer(text, start):
+            pending.append(text[start:match.start()])
+            sentence = "".join(pending).strip()
+            pending = []
+            if sentence:
+                yield sentence
+            start = match.end()
+        pending.append(text[start:])
+        prev = piece[-1]
+    sentence = "".join(pending).strip()
+    if sentence:
+        yield sentence
+
+
+def count_tokens(text: str) -> int:
+    """
+    Approximates the token count of a text as words plus punctuation marks,
+    counting each character of CJK and other unspaced scripts separately and
+    long runs of letters/digits in pieces of _MAX_TOKEN_CHARS characters.
+    Subword tokenizers usually produce more tokens than this, especially for
+    non-English text; pass the model's tokenizer where accuracy matters.
+    """
+    return len(_TOKEN_RE.findall(text))
+
+
+def iter_chunks(
+    sentences: Iterable[str],
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    overlap_tokens: int = DEFAULT_OVERLAP_TOKENS,
+    token_counter: Callable[[str], int] = count_tokens,
+) -> Iterator[str]:
+    """
+    Groups sentences into chunks of at most max_tokens tokens, carrying up to
+    overlap_tokens worth of trailing sentences into the next chunk.
+    Sentences longer than max_tokens are split on word boundaries, and words
+    longer than max_tokens are cut further; overlap applies to those pieces too.
+    token_counter must be additive over whitespace-separated pieces: the count
+    of a text should equal the sum of the counts of its words.
+    """
+    if max_tokens <= 0:
+        raise ValueError("max_tokens must be positive")
+    if not 0 <= overlap_tokens < max_tokens:
+        raise ValueError("overlap_tokens must be between 0 and max_tokens")
+
+    window = deque()
+    total = 0
+    for sentence in sentences:
+        n = token_counter(sentence)
+        if n <= max_tokens:
+            units = [(sentence, n, " ")]
+        else:
+            units = _iter_units(sentence, max_tokens, token_counter)
+
+        for unit in units:
+            n = unit[1]
+            if window and total + n > max_tokens:
+                yield _join_units(window)
+                while window and (total > overlap_tokens or total + n > max_tokens):
+                    total -= window.popleft()[1]
+            window.append(unit)
+            total += n
+
+    if window:
+        yield _join_units(window)
+
+
+def chunk_text(
+    text: Union[str, Iterable[str]],
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    overlap_tokens: int = DEFAULT_OVERLAP_TOKENS,
+    token_counter: Callable[[str], int] = count_tokens,
+) -> list:
+    """
+    Splits text (a string or an iterable of streamed pieces) into
+    sentence-aligned chunks.
+    """
+    pieces = [text] if isinstance(text, str) else text
+    return list(iter_chunks(iter_sentences(pieces), max_tokens, overlap_tokens, token_counter))
+
+
+def _join_units(units: Iterable[tuple]) -> str:
+    """
+    Joins (piece, tokens, separator) units, dropping the leading separator.
+    """
+    parts = []
+    for piece, _, separator in units:
+        if parts:
+            parts.append(separator)
+        parts.append(piece)
+    return "".join(parts)
+
+
+def _iter_units(sentence: str, max_tokens: int, token_counter: Callable[[str], int]) -> Iterator[tuple]:
+    """
+    Yields (piece, tokens, separator) units of a sentence. Words over
+    max_tokens are broken into approximate tokens, and any token still
+    longer than max_tokens characters is cut by characters.
+    """
+    for word in sentence.split():
+        n = token_counter(word)
+        if n <= max_tokens:
+            yield word, n, " "
+            continue
+        separator = " "
+        for token in _TOKEN_RE.findall(word):
+            for i in range(0, len(token), max_tokens):
+                piece = token[i:i + max_tokens]
+                yield piece, token_counter(piece), separator
+                separator = ""
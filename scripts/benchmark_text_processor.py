@@ -0,0 +1,86 @@
+"""
+Micro-benchmark for app.utils.text_processor against the previous
+clean_text implementation and LangChain's RecursiveCharacterTextSplitter.
+
+Run from the repository root:
+    python -m scripts.benchmark_text_processor --mb 5
+"""
+import argparse
+import random
+import re
+import time
+
+from app.utils.text_processor import chunk_text, clean_text, iter_clean_text
+
+WORDS = [
+    "document", "retrieval", "naïve", "café", "Zürich", "résumé", "Ελληνικά",
+    "Здравствуйте", "embedding", "vector", "search\x00", "index", "query",
+    "model\t", "context", "answer", "chunk", "sentence", "the", "of", "and",
+]
+ENDINGS = [" ", " ", " ", "  ", "\n", ". ", ".\n\n", "! ", "? "]
+
+
+def legacy_clean_text(text: str) -> str:
+    text = re.sub(r"\s+", " ", text)
+    text = text.replace("\x00", "")
+    text = re.sub(r"[^ -~]+", " ", text)
+    return text.strip()
+
+
+def make_text(size_mb: float, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    target = int(size_mb * 1024 * 1024)
+    parts = []
+    length = 0
+    while length < target:
+        part = rng.choice(WORDS) + rng.choice(ENDINGS)
+        parts.append(part)
+        length += len(part)
+    return "".join(parts)
+
+
+def timed(label: str, func, repeat: int):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<42} {best * 1000:9.1f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mb", type=float, default=5.0, help="size of generated text in MB")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--stream-kb", type=int, default=64, help="piece size for streamed runs")
+    args = parser.parse_args()
+
+    text = make_text(args.mb)
+    step = args.stream_kb * 1024
+    pieces = [text[i:i + step] for i in range(0, len(text), step)]
+    print(f"Input: {len(text) / 1e6:.2f}M characters, {len(pieces)} stream pieces\n")
+
+    timed("legacy clean_text (3 passes, ASCII only)", lambda: legacy_clean_text(text), args.repeat)
+    cleaned = timed("clean_text", lambda: clean_text(text), args.repeat)
+    timed("iter_clean_text (streamed)", lambda: "".join(iter_clean_text(pieces)), args.repeat)
+    print()
+
+    try:
+        from langchain.text_splitter import RecursiveCharacterTextSplitter
+    except ImportError:
+        print("langchain not installed, skipping RecursiveCharacterTextSplitter")
+    else:
+        splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
+        chunks = timed("RecursiveCharacterTextSplitter", lambda: splitter.split_text(cleaned), args.repeat)
+        print(f"{'':<42} {len(chunks)} chunks")
+
+    chunks = timed("chunk_text", lambda: chunk_text(cleaned), args.repeat)
+    print(f"{'':<42} {len(chunks)} chunks")
+    cleaned_pieces = [cleaned[i:i + step] for i in range(0, len(cleaned), step)]
+    timed("chunk_text (streamed)", lambda: chunk_text(cleaned_pieces), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
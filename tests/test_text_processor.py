@@ -0,0 +1,174 @@
+import pytest
+
+import app.utils.text_processor as text_processor
+from app.utils.text_processor import (
+    chunk_text,
+    clean_text,
+    count_tokens,
+    iter_chunks,
+    iter_clean_text,
+    iter_sentences,
+    split_sentences,
+)
+
+
+def split_at(text, *cuts):
+    bounds = [0, *cuts, len(text)]
+    return [text[a:b] for a, b in zip(bounds, bounds[1:])]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "alpha   beta\n\n gamma",
+        "a\x00\x00b c\x01\x02 d",
+        "One. Two! Three?  Four",
+        "  leading and trailing  ",
+        "x \x00 y",
+    ],
+)
+def test_iter_clean_text_matches_clean_text_at_every_split(text):
+    expected = clean_text(text)
+    for i in range(len(text) + 1):
+        for j in range(i, len(text) + 1):
+            assert "".join(iter_clean_text(split_at(text, i, j))) == expected
+
+
+def test_clean_text_preserves_unicode_and_drops_controls():
+    text = " Crème\x00 brûlée\u200b naïve\n\n Здравствуй 你好 \ufeff"
+    assert clean_text(text) == "Crème brûlée naïve Здравствуй 你好"
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "First one. Second one! Third?  Fourth without end",
+        "Ends right here.",
+        "你好。世界！再见？ Latin. tail",
+        "No terminators at all",
+    ],
+)
+def test_iter_sentences_matches_split_sentences_at_every_split(text):
+    expected = split_sentences(text)
+    for i in range(len(text) + 1):
+        for j in range(i, len(text) + 1):
+            assert list(iter_sentences(split_at(text, i, j))) == expected
+
+
+def test_split_sentences_on_full_width_terminators():
+    assert split_sentences("你好。世界！再见？ Done. ok") == ["你好。", "世界！", "再见？", "Done.", "ok"]
+
+
+class CountingPattern:
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.scanned = 0
+
+    def finditer(self, text, pos=0):
+        self.scanned += len(text) - pos
+        return self.pattern.finditer(text, pos)
+
+
+def test_iter_sentences_scans_each_character_once(monkeypatch):
+    pattern = CountingPattern(text_processor._SENTENCE_END_RE)
+    monkeypatch.setattr(text_processor, "_SENTENCE_END_RE", pattern)
+    text = "word " * 20_000
+    pieces = [text[i:i + 1024] for i in range(0, len(text), 1024)]
+
+    assert list(iter_sentences(pieces)) == [text.strip()]
+    assert pattern.scanned == len(text)
+
+
+def test_count_tokens_counts_unspaced_scripts_per_character():
+    assert count_tokens("hello, world") == 3
+    assert count_tokens("中文句子") == 4
+    assert count_tokens("abc中文") == 3
+
+
+def test_count_tokens_keeps_combining_marks_in_words():
+    assert count_tokens("cafe\u0301") == 1
+    assert count_tokens("नमस्ते") == 1
+
+
+def test_count_tokens_bounds_unspaced_runs():
+    assert count_tokens("a" * 100) == 10
+
+
+def test_chunks_respect_max_tokens_and_carry_overlap():
+    sentences = [f"Sentence number {i} here." for i in range(50)]
+    chunks = list(iter_chunks(sentences, max_tokens=20, overlap_tokens=5))
+
+    assert len(chunks) > 1
+    assert all(count_tokens(chunk) <= 20 for chunk in chunks)
+    for previous, current in zip(chunks, chunks[1:]):
+        last_sentence = split_sentences(previous)[-1]
+        assert current.startswith(last_sentence)
+
+
+def test_chunks_without_overlap_cover_all_sentences_once():
+    sentences = [f"Sentence number {i} here." for i in range(50)]
+    chunks = list(iter_chunks(sentences, max_tokens=20, overlap_tokens=0))
+    assert " ".join(chunks) == " ".join(sentences)
+
+
+def test_chunk_text_accepts_streamed_pieces():
+    text = clean_text("Sentence one is here. " * 200)
+    pieces = [text[i:i + 37] for i in range(0, len(text), 37)]
+    assert chunk_text(pieces, 30, 10) == chunk_text(text, 30, 10)
+
+
+def test_long_sentence_is_split_on_words():
+    sentence = " ".join(f"w{i}" for i in range(95))
+    chunks = chunk_text(sentence, max_tokens=20, overlap_tokens=0)
+    assert [count_tokens(chunk) for chunk in chunks] == [20, 20, 20, 20, 15]
+    assert " ".join(chunks) == sentence
+
+
+def test_long_sentence_pieces_carry_overlap():
+    sentence = " ".join(f"w{i}" for i in range(1000))
+    chunks = chunk_text(sentence, max_tokens=200, overlap_tokens=40)
+
+    assert all(count_tokens(chunk) <= 200 for chunk in chunks)
+    for previous, current in zip(chunks, chunks[1:]):
+        assert current.split()[:40] == previous.split()[-40:]
+
+
+def test_overlap_carries_across_long_sentence_boundaries():
+    sentences = ["Short lead in.", " ".join(f"w{i}" for i in range(30)), "Short tail."]
+    chunks = list(iter_chunks(sentences, max_tokens=20, overlap_tokens=5))
+
+    assert chunks[0].startswith("Short lead in. w0")
+    assert chunks[-1].endswith("w29 Short tail.")
+    assert all(count_tokens(chunk) <= 20 for chunk in chunks)
+
+
+def test_long_word_falls_back_to_token_and_character_cuts():
+    chunks = chunk_text("a-" * 300, overlap_tokens=0)
+    assert [count_tokens(chunk) for chunk in chunks] == [200, 200, 200]
+    assert "".join(chunks) == "a-" * 300
+
+    chunks = chunk_text("x" * 450, max_tokens=200, overlap_tokens=0, token_counter=len)
+    assert [len(chunk) for chunk in chunks] == [200, 200, 50]
+
+
+def test_unspaced_run_is_chunked():
+    chunks = chunk_text("a" * 100000, overlap_tokens=0)
+    assert all(count_tokens(chunk) <= 200 for chunk in chunks)
+    assert max(len(chunk) for chunk in chunks) == 2000
+    assert "".join(chunks) == "a" * 100000
+
+
+def test_cjk_document_is_chunked():
+    text = clean_text("这是一个很长的中文句子用于测试分块功能。" * 2000)
+    chunks = chunk_text(text)
+    assert len(chunks) > 1
+    assert all(count_tokens(chunk) <= 200 for chunk in chunks)
+
+
+@pytest.mark.parametrize(
+    "max_tokens, overlap_tokens",
+    [(0, 0), (-1, 0), (10, -1), (10, 10), (10, 11)],
+)
+def test_iter_chunks_rejects_bad_arguments(max_tokens, overlap_tokens):
+    with pytest.raises(ValueError):
+        list(iter_chunks(["a."], max_tokens, overlap_tokens))